@@ -39,6 +39,7 @@ from .extract.datasets.extract_spell_classes import (
     extract_spell_classes,
 )
 from .extract.datasets.extract_spells import extract_spells
+from .extract.text_parser_utils import clear_page_words
 from .parse.parse_ability_scores import parse_ability_scores
 from .parse.parse_classes import parse_classes
 from .parse.parse_conditions import parse_condition_records
@@ -73,6 +74,7 @@ from .utils.metadata import (
     read_schema_version,
     wrap_with_meta,
 )
+from .utils.pdf_probe import close_shared_pdfs
 from .utils.table_indexer import TableIndexer
 from .utils.validate_references import validate_references
 
@@ -1175,7 +1177,23 @@ def _generate_table_page_index(
         return None
 
 
-def build(  # noqa: C901
+def build(
+    ruleset: str,
+    output_format: str,
+    out_dir: Path,
+    bundle: bool = False,
+    skip_datasets: set[str] | None = None,
+) -> Path:
+    # Extractors share one cached PDF handle and per-page word lists for the
+    # whole run; release both once the build finishes (or fails).
+    try:
+        return _build(ruleset, output_format, out_dir, bundle, skip_datasets)
+    finally:
+        close_shared_pdfs()
+        clear_page_words()
+
+
+def _build(  # noqa: C901
     ruleset: str,
     output_format: str,
     out_dir: Path,
@@ -7,14 +7,17 @@ using PyMuPDF auto-detection and reference data configuration.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
 import fitz  # PyMuPDF
 
+from ..utils.pdf_probe import close_shared_pdfs, shared_pdf
 from .extraction_metadata import get_table_metadata
 from .patterns import RawTable, extract_by_config
 from .table_targets import TARGET_TABLES, TableTarget
+from .text_parser_utils import clear_page_words
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +25,29 @@ logger = logging.getLogger(__name__)
 MIN_TABLE_ROWS = 2  # Minimum rows required (header + at least one data row)
 
 
+def check_expected_rows(table: RawTable, config: dict[str, Any]) -> bool:
+    """Warn when a table's row count differs from its ``validation.expected_rows``.
+
+    One shared check for every configured table instead of per-parser
+    ``len(rows) != N`` branches. The message is only formatted when the
+    count is actually off.
+
+    Args:
+        table: Extracted table
+        config: Table metadata config (may omit ``validation``)
+
+    Returns:
+        True if the count matches or no expectation is configured
+    """
+    expected = config.get("validation", {}).get("expected_rows")
+    if expected is None or len(table.rows) == expected:
+        return True
+    logger.warning(
+        "%s: expected %d rows, extracted %d", table.simple_name, expected, len(table.rows)
+    )
+    return False
+
+
 class TableExtractor:
     """Extract reference tables from SRD PDF using hybrid approach."""
 
@@ -32,14 +58,27 @@ class TableExtractor:
             pdf_path: Path to SRD PDF file
         """
         self.pdf_path = Path(pdf_path)
-        self.doc = fitz.open(self.pdf_path)
         logger.info(f"Opened PDF: {self.pdf_path} ({len(self.doc)} pages)")
 
-    def extract_all_tables(self, skip_failures: bool = False) -> list[RawTable]:
+    @property
+    def doc(self) -> fitz.Document:
+        """The run-wide shared handle for this PDF (see ``shared_pdf``).
+
+        Looked up on every access rather than stored: the pattern engines
+        read through the same handle, and ``shared_pdf`` may have reopened it
+        (file changed) or the run owner may have closed it since.
+        """
+        return shared_pdf(self.pdf_path)
+
+    def extract_all_tables(
+        self, skip_failures: bool = False, only: Iterable[str] | None = None
+    ) -> list[RawTable]:
         """Extract all target tables using hybrid approach.
 
         Args:
             skip_failures: If True, skip tables that fail to extract
+            only: Optional simple_names to extract; other targets are skipped
+                without touching their pages
 
         Returns:
             List of raw table data
@@ -47,7 +86,15 @@ class TableExtractor:
         tables = []
         failed = []
 
-        for target in TARGET_TABLES:
+        targets = TARGET_TABLES
+        if only is not None:
+            wanted = set(only)
+            unknown = wanted - {t["simple_name"] for t in TARGET_TABLES}
+            if unknown:
+                raise ValueError(f"Unknown table(s): {', '.join(sorted(unknown))}")
+            targets = [t for t in TARGET_TABLES if t["simple_name"] in wanted]
+
+        for target in targets:
             logger.info(f"Extracting: {target['name']} (page {target['page']})")
             try:
                 raw_table = self._extract_single_table(target)
@@ -88,7 +135,7 @@ class TableExtractor:
             pattern_type = config.get("pattern_type")
             logger.debug(f"  Using pattern '{pattern_type}' for {simple_name}")
 
-            return extract_by_config(
+            raw_table = extract_by_config(
                 table_id=target["id"],
                 simple_name=simple_name,
                 page=target["page"],
@@ -96,6 +143,8 @@ class TableExtractor:
                 section=target["section"],
                 pdf_path=str(self.pdf_path),  # Pass PDF path for extraction patterns
             )
+            check_expected_rows(raw_table, config)
+            return raw_table
 
         # Fall back to PyMuPDF auto-detection for tables without config
         logger.debug(f"  No config found, trying auto-detection for {simple_name}")
@@ -208,8 +257,14 @@ class TableExtractor:
         )
 
     def close(self) -> None:
-        """Close the PDF document."""
-        self.doc.close()
+        """Release this extractor.
+
+        The extractor owns no document of its own: the shared handle and the
+        per-page word cache belong to the run, and other extractors or
+        patterns may still be using them. Whoever owns the run releases them
+        with ``close_shared_pdfs()`` / ``clear_page_words()`` (``build()``
+        and ``extract_tables_to_json()`` both do).
+        """
 
     def __enter__(self) -> TableExtractor:
         """Context manager entry."""
@@ -232,8 +287,14 @@ def extract_tables_to_json(
     """
     import json
 
-    with TableExtractor(pdf_path) as extractor:
-        tables = extractor.extract_all_tables(skip_failures=skip_failures)
+    # This function owns the run, so it releases the shared PDF handle and
+    # page-word cache once extraction is done (or fails).
+    try:
+        with TableExtractor(pdf_path) as extractor:
+            tables = extractor.extract_all_tables(skip_failures=skip_failures)
+    finally:
+        close_shared_pdfs()
+        clear_page_words()
 
     # Convert to dict for JSON serialization
     tables_dict = {
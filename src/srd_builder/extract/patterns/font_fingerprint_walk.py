@@ -10,6 +10,7 @@ from __future__ import annotations
 import re
 from typing import Any
 
+from ...utils.pdf_probe import shared_pdf
 from ._shared import (
     _DEFAULT_STRUCTURAL_PATTERNS,
     _resolve_body_cleanup,
@@ -150,10 +151,6 @@ def _font_fingerprint_walk_span_mode(
     Original prototype path used by extract_features. Kept narrow on purpose:
     new pattern complexity goes in _font_fingerprint_walk_line_mode().
     """
-    from pathlib import Path
-
-    from ...utils.pdf_probe import open_pdf
-
     fingerprints = config["header_fingerprints"]
     filter_structural = config.get("filter_structural", False)
     structural_re_list = [
@@ -168,36 +165,36 @@ def _font_fingerprint_walk_span_mode(
     records: list[dict[str, Any]] = []
     current: dict[str, Any] | None = None
 
-    with open_pdf(Path(pdf_path)) as pdf:
-        for page_num in pages:
-            if page_reset_record and current is not None:
-                records.append(current)
-                current = None
+    pdf = shared_pdf(pdf_path)  # shared run-wide handle; do not close
+    for page_num in pages:
+        if page_reset_record and current is not None:
+            records.append(current)
+            current = None
 
-            page = pdf[page_num - 1]
-            for block in page.get_text("dict")["blocks"]:
-                if "lines" not in block:
-                    continue
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        text = span["text"].strip()
-                        matched_fp: dict[str, Any] | None = None
-                        for fp in fingerprints:
-                            if _span_matches_fingerprint(span, fp):
-                                matched_fp = fp
-                                break
-
-                        if matched_fp is not None:
-                            if current is not None:
-                                records.append(current)
-                            name = text
-                            if matched_fp.get("strip_trailing_period_from_name", False):
-                                name = name.rstrip(".")
-                            current = {"name": name, "text": "", "page": page_num}
-                        elif current is not None and text:
-                            if filter_structural and _is_structural(text):
-                                continue
-                            current["text"] += text + " "
+        page = pdf[page_num - 1]
+        for block in page.get_text("dict")["blocks"]:
+            if "lines" not in block:
+                continue
+            for line in block["lines"]:
+                for span in line["spans"]:
+                    text = span["text"].strip()
+                    matched_fp: dict[str, Any] | None = None
+                    for fp in fingerprints:
+                        if _span_matches_fingerprint(span, fp):
+                            matched_fp = fp
+                            break
+
+                    if matched_fp is not None:
+                        if current is not None:
+                            records.append(current)
+                        name = text
+                        if matched_fp.get("strip_trailing_period_from_name", False):
+                            name = name.rstrip(".")
+                        current = {"name": name, "text": "", "page": page_num}
+                    elif current is not None and text:
+                        if filter_structural and _is_structural(text):
+                            continue
+                        current["text"] += text + " "
 
     if current is not None:
         records.append(current)
@@ -226,10 +223,6 @@ def _font_fingerprint_walk_line_mode(
           simplified dicts and routed to a bucket based on per-line predicate.
         - Optional post_pass merges short records into the next.
     """
-    from pathlib import Path
-
-    from ...utils.pdf_probe import open_pdf
-
     fingerprints = config["header_fingerprints"]
     match_mode = config.get("header_match_mode", "any_span")
     continuation_words: set[str] = {
@@ -267,75 +260,73 @@ def _font_fingerprint_walk_line_mode(
     pending_name: str | None = None
     pending_fp: dict[str, Any] | None = None
 
-    with open_pdf(Path(pdf_path)) as pdf:
-        for page_num in pages:
-            page = pdf[page_num - 1]
-            for block in page.get_text("dict")["blocks"]:
-                if block.get("type") != 0:
+    pdf = shared_pdf(pdf_path)  # shared run-wide handle; do not close
+    for page_num in pages:
+        page = pdf[page_num - 1]
+        for block in page.get_text("dict")["blocks"]:
+            if block.get("type") != 0:
+                continue
+            for line in block.get("lines", []):
+                raw_spans = line.get("spans", [])
+                if not raw_spans:
+                    continue
+                simple_spans = [_simplify_span(s) for s in raw_spans]
+                line_text = "".join(s["text"] for s in simple_spans).strip()
+                if not line_text:
                     continue
-                for line in block.get("lines", []):
-                    raw_spans = line.get("spans", [])
-                    if not raw_spans:
-                        continue
-                    simple_spans = [_simplify_span(s) for s in raw_spans]
-                    line_text = "".join(s["text"] for s in simple_spans).strip()
-                    if not line_text:
-                        continue
 
-                    header_fp = _line_matches_header(raw_spans)
-
-                    if header_fp is not None:
-                        # Header line. Build / extend the pending name.
-                        if pending_name is not None:
-                            pending_name = pending_name.strip() + " " + line_text
-                        else:
-                            pending_name = line_text
-                            pending_fp = header_fp
-                        # Defer commit if trailing word signals continuation.
-                        last_word = pending_name.split()[-1].lower() if pending_name.split() else ""
-                        if last_word in continuation_words:
-                            continue
-                        # Otherwise fall through: header is complete on this line,
-                        # but the original code only finalizes on the *next*
-                        # non-header line. Preserve that timing.
-                        continue
+                header_fp = _line_matches_header(raw_spans)
 
-                    # Non-header line. If we have a pending header, finalize it
-                    # into a new record now.
+                if header_fp is not None:
+                    # Header line. Build / extend the pending name.
                     if pending_name is not None:
-                        if current is not None:
-                            records.append(current)
-                        name = pending_name
-                        if pending_fp is not None and pending_fp.get(
-                            "strip_trailing_period_from_name", False
-                        ):
-                            name = name.rstrip(".")
-                        current = _new_record(name, page_num)
-                        pending_name = None
-                        pending_fp = None
-
-                    if current is None:
+                        pending_name = pending_name.strip() + " " + line_text
+                    else:
+                        pending_name = line_text
+                        pending_fp = header_fp
+                    # Defer commit if trailing word signals continuation.
+                    last_word = pending_name.split()[-1].lower() if pending_name.split() else ""
+                    if last_word in continuation_words:
                         continue
-                    bucket = _line_bucket_for_spans(simple_spans, body_buckets)
-                    current[bucket].extend(simple_spans)
-
-            # End of page. Flush any pending name as its own record (mirrors
-            # the original per-page finalize behavior).
-            if pending_name is not None:
-                if current is not None:
-                    records.append(current)
-                name = pending_name
-                if pending_fp is not None and pending_fp.get(
-                    "strip_trailing_period_from_name", False
-                ):
-                    name = name.rstrip(".")
-                current = _new_record(name, page_num)
-                pending_name = None
-                pending_fp = None
-
-            if page_reset_record and current is not None:
+                    # Otherwise fall through: header is complete on this line,
+                    # but the original code only finalizes on the *next*
+                    # non-header line. Preserve that timing.
+                    continue
+
+                # Non-header line. If we have a pending header, finalize it
+                # into a new record now.
+                if pending_name is not None:
+                    if current is not None:
+                        records.append(current)
+                    name = pending_name
+                    if pending_fp is not None and pending_fp.get(
+                        "strip_trailing_period_from_name", False
+                    ):
+                        name = name.rstrip(".")
+                    current = _new_record(name, page_num)
+                    pending_name = None
+                    pending_fp = None
+
+                if current is None:
+                    continue
+                bucket = _line_bucket_for_spans(simple_spans, body_buckets)
+                current[bucket].extend(simple_spans)
+
+        # End of page. Flush any pending name as its own record (mirrors
+        # the original per-page finalize behavior).
+        if pending_name is not None:
+            if current is not None:
                 records.append(current)
-                current = None
+            name = pending_name
+            if pending_fp is not None and pending_fp.get("strip_trailing_period_from_name", False):
+                name = name.rstrip(".")
+            current = _new_record(name, page_num)
+            pending_name = None
+            pending_fp = None
+
+        if page_reset_record and current is not None:
+            records.append(current)
+            current = None
 
     if current is not None:
         records.append(current)
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from ...utils.pdf_probe import shared_pdf
 from ._shared import (
     _bucket_text,
     _make_span_block,
@@ -187,10 +188,6 @@ def _extract_font_stateful_walk(
         "$bold_from_font"   → bool from font name
         "$italic_from_font" → bool from font name
     """
-    from pathlib import Path
-
-    from ...utils.pdf_probe import open_pdf
-
     header_fp = config["header_fingerprint"]
     subfields: list[str] = config.get("subfields", [])
     buckets: list[str] = config["buckets"]
@@ -213,77 +210,76 @@ def _extract_font_stateful_walk(
         current = None
         state = initial_state
 
-    with open_pdf(Path(pdf_path)) as pdf:
-        for page_num in pages:
-            page = pdf[page_num - 1]
-            for block in page.get_text("dict").get("blocks", []):
-                if block.get("type") != 0:
-                    continue
-                for line in block.get("lines", []):
-                    for span in line.get("spans", []):
-                        text = span.get("text", "").strip()
-                        if not text:
+    pdf = shared_pdf(pdf_path)  # shared run-wide handle; do not close
+    for page_num in pages:
+        page = pdf[page_num - 1]
+        for block in page.get_text("dict").get("blocks", []):
+            if block.get("type") != 0:
+                continue
+            for line in block.get("lines", []):
+                for span in line.get("spans", []):
+                    text = span.get("text", "").strip()
+                    if not text:
+                        continue
+
+                    # Header detection always takes precedence.
+                    if _span_matches_predicate(span, header_fp):
+                        commit_current()
+                        current = _new_stateful_record(
+                            text, page_num, subfields, buckets, track_pages_list
+                        )
+                        state = initial_state
+                        continue
+
+                    # Evaluate span_rules in order; first match wins.
+                    for rule in span_rules:
+                        if not _span_matches_predicate(span, rule.get("match", {})):
                             continue
-
-                        # Header detection always takes precedence.
-                        if _span_matches_predicate(span, header_fp):
-                            commit_current()
+                        if not _guard_passes(rule.get("guard"), current, state):
+                            continue
+                        if current is None:
+                            if rule.get("if_no_record", "skip") != "create_nameless":
+                                break  # rule matched but cannot fire; stop
                             current = _new_stateful_record(
-                                text, page_num, subfields, buckets, track_pages_list
+                                "", page_num, subfields, buckets, track_pages_list
                             )
                             state = initial_state
-                            continue
-
-                        # Evaluate span_rules in order; first match wins.
-                        for rule in span_rules:
-                            if not _span_matches_predicate(span, rule.get("match", {})):
-                                continue
-                            if not _guard_passes(rule.get("guard"), current, state):
-                                continue
-                            if current is None:
-                                if rule.get("if_no_record", "skip") != "create_nameless":
-                                    break  # rule matched but cannot fire; stop
-                                current = _new_stateful_record(
-                                    "", page_num, subfields, buckets, track_pages_list
+                        action = rule["action"]
+                        atype = action["type"]
+                        attach = action.get("attach", {})
+                        block_dict = _make_span_block(span, attach)
+                        if atype == "set_subfield":
+                            current[action["name"]] = text
+                            also = action.get("also_append_to")
+                            if also:
+                                current[also].append(block_dict)
+                        elif atype == "append_to_bucket":
+                            current[action["bucket"]].append(block_dict)
+                        elif atype == "append_to_state_bucket":
+                            bucket = action["state_buckets"].get(state)
+                            if bucket is None:
+                                raise ValueError(
+                                    f"append_to_state_bucket: no bucket mapped for state '{state}'"
                                 )
-                                state = initial_state
-                            action = rule["action"]
-                            atype = action["type"]
-                            attach = action.get("attach", {})
-                            block_dict = _make_span_block(span, attach)
-                            if atype == "set_subfield":
-                                current[action["name"]] = text
-                                also = action.get("also_append_to")
-                                if also:
-                                    current[also].append(block_dict)
-                            elif atype == "append_to_bucket":
-                                current[action["bucket"]].append(block_dict)
-                            elif atype == "append_to_state_bucket":
-                                bucket = action["state_buckets"].get(state)
-                                if bucket is None:
-                                    raise ValueError(
-                                        f"append_to_state_bucket: no bucket mapped "
-                                        f"for state '{state}'"
-                                    )
-                                current[bucket].append(block_dict)
-                            else:
-                                raise ValueError(f"Unknown rule action type '{atype}'")
-                            # Only run state transitions if the rule asked for it.
-                            # Mirrors the original extract_spells behavior where the
-                            # "Duration:" trigger only takes effect after a regular-text
-                            # append, not after a field-label append that happened to
-                            # contain the trigger text.
-                            if rule.get("check_state_transitions_after", False):
-                                state = _apply_state_transitions(current, state, state_transitions)
-                            break  # rule matched; do not evaluate further rules
-
-            # End of page: decide whether to carry the current record.
-            if current is not None:
-                if _carry_predicate_holds(carry_if, current):
-                    # Keep current + state intact for next page.
-                    pass
-                else:
-                    commit_current()
+                            current[bucket].append(block_dict)
+                        else:
+                            raise ValueError(f"Unknown rule action type '{atype}'")
+                        # Only run state transitions if the rule asked for it.
+                        # Mirrors the original extract_spells behavior where the
+                        # "Duration:" trigger only takes effect after a regular-text
+                        # append, not after a field-label append that happened to
+                        # contain the trigger text.
+                        if rule.get("check_state_transitions_after", False):
+                            state = _apply_state_transitions(current, state, state_transitions)
+                        break  # rule matched; do not evaluate further rules
+
+        # End of page: decide whether to carry the current record.
+        if current is not None:
+            if _carry_predicate_holds(carry_if, current):
+                # Keep current + state intact for next page.
+                pass
+            else:
+                commit_current()
 
     if current is not None:
         records.append(current)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from ..text_parser_utils import column_edges, page_words, sorted_word_rows, split_row_columns
 from ._types import RawTable
 
 logger = logging.getLogger(__name__)
@@ -29,10 +30,6 @@ def _extract_multipage_text_region(
             - page: int - Page number
             - x_min, x_max, y_min, y_max: coordinates
     """
-    import pymupdf
-
-    from ..text_parser_utils import group_words_by_y
-
     pages = config["pages"]
     headers = config["headers"]
     regions = config["regions"]
@@ -45,20 +42,17 @@ def _extract_multipage_text_region(
             f"got {len(regions)} regions for {len(pages)} pages"
         )
 
-    doc = pymupdf.open(pdf_path)
-
     # Collect all rows from all pages
     all_rows_dict = {}
 
     for region in regions:
         page_num = region["page"]
-        page_obj = doc[page_num - 1]  # Convert to 0-indexed
 
-        # Get all words from page
-        words = page_obj.get_text("words")
+        # Get all words from page (shared per-page cache)
+        words = page_words(pdf_path, page_num)
 
-        # Filter words to region and group by Y-coordinate
-        rows_dict = group_words_by_y(
+        # Filter words to region and group into X-sorted rows
+        word_rows = sorted_word_rows(
             words,
             y_tolerance=2.0,
             x_min=region["x_min"],
@@ -69,40 +63,27 @@ def _extract_multipage_text_region(
 
         # Merge with global offset to maintain sort order across pages
         # Use page_num * 1000 + y_pos to ensure proper ordering
-        for y_pos, row_words in rows_dict.items():
+        for y_pos, row_words in word_rows:
             global_y = page_num * 1000 + y_pos
             all_rows_dict[global_y] = row_words
 
-    doc.close()
-
     # Build table rows
     rows: list[list[str | int | float]] = []
     column_boundaries = config.get("column_boundaries")
 
     if column_boundaries:
-        # Multi-column with explicit boundaries
-        for _y_pos, row_words in sorted(all_rows_dict.items()):
-            sorted_words = sorted(row_words, key=lambda w: w[0])
-
-            row = []
-            for col_idx in range(num_columns):
-                # Use first region for column boundary reference
-                x_start = column_boundaries[col_idx - 1] if col_idx > 0 else regions[0]["x_min"]
-                x_end = (
-                    column_boundaries[col_idx]
-                    if col_idx < len(column_boundaries)
-                    else regions[0]["x_max"]
-                )
-
-                col_words = [text for x, text in sorted_words if x_start <= x < x_end]
-                row.append(" ".join(col_words))
+        # Multi-column with explicit boundaries (first region is the X reference)
+        edges = column_edges(
+            column_boundaries, num_columns, regions[0]["x_min"], regions[0]["x_max"]
+        )
+        for _y_pos, sorted_words in sorted(all_rows_dict.items()):
+            row = split_row_columns(sorted_words, edges)
 
             if row:
                 rows.append(row)  # type: ignore[arg-type]
     else:
         # Single-column or simple layout
-        for _y_pos, row_words in sorted(all_rows_dict.items()):
-            sorted_words = sorted(row_words, key=lambda w: w[0])
+        for _y_pos, sorted_words in sorted(all_rows_dict.items()):
             row_text = " ".join([text for _, text in sorted_words])
             if row_text.strip():
                 rows.append([row_text])
@@ -5,6 +5,8 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from ...utils.pdf_probe import shared_pdf
+from ...utils.prose import ProseExtractor
 from ._types import RawTable
 
 logger = logging.getLogger(__name__)
@@ -28,10 +30,6 @@ def _extract_prose_section(
         headers: ["name", "text", "page"]
         rows: [[section_name, prose_text, page_num], ...]
     """
-    from pathlib import Path
-
-    from ...utils.prose import ProseExtractor
-
     # Get page range
     if isinstance(page, list):
         start_page, end_page = page[0], page[-1]
@@ -50,7 +48,8 @@ def _extract_prose_section(
         end_page=end_page,
     )
 
-    sections, warnings = extractor.extract_from_pdf(Path(pdf_path))
+    # Read through the run's shared handle rather than reopening the PDF
+    sections, warnings = extractor.extract_from_pdf(shared_pdf(pdf_path))
 
     # Convert to table format
     rows = []
@@ -3,8 +3,17 @@
 from __future__ import annotations
 
 import logging
+import math
 from typing import Any
 
+from ..text_parser_utils import (
+    column_edges,
+    is_header_row,
+    merge_continuation_rows,
+    page_words,
+    sorted_word_rows,
+    split_row_columns,
+)
 from ._types import RawTable
 
 logger = logging.getLogger(__name__)
@@ -28,10 +37,6 @@ def _extract_text_region(
         - headers: list[str] - Column headers
         - region: dict with x_min, x_max, y_min, y_max coordinates
     """
-    import pymupdf
-
-    from ..text_parser_utils import group_words_by_y
-
     pages = config["pages"]
     if not isinstance(pages, list) or len(pages) != 1:
         raise ValueError(f"{simple_name}: text_region requires single page, got {pages}")
@@ -40,16 +45,13 @@ def _extract_text_region(
     headers = config["headers"]
     region = config["region"]
     num_columns = len(headers)
+    header_names = {h.lower() for h in headers}
 
-    doc = pymupdf.open(pdf_path)
-    page_obj = doc[page_num - 1]  # Convert to 0-indexed
+    # Get all words from page (shared per-page cache)
+    words = page_words(pdf_path, page_num)
 
-    # Get all words from page
-    words = page_obj.get_text("words")
-    doc.close()
-
-    # Filter words to region and group by Y-coordinate
-    rows_dict = group_words_by_y(
+    # Filter words to region and group into rows (top-to-bottom, left-to-right)
+    word_rows = sorted_word_rows(
         words,
         y_tolerance=2.0,
         x_min=region["x_min"],
@@ -67,66 +69,31 @@ def _extract_text_region(
     if column_boundaries:
         # Multi-column with explicit boundaries: group words into columns by x-coordinate
         # column_boundaries = [x1, x2, x3] means: col1: [min, x1), col2: [x1, x2), col3: [x2, x3), col4: [x3, max)
-        for _y_pos, row_words in sorted(rows_dict.items()):
-            sorted_words = sorted(row_words, key=lambda w: w[0])
-
-            row = []
-            for col_idx in range(num_columns):
-                # Determine column x-range
-                x_start = column_boundaries[col_idx - 1] if col_idx > 0 else region["x_min"]
-                x_end = (
-                    column_boundaries[col_idx]
-                    if col_idx < len(column_boundaries)
-                    else region["x_max"]
-                )
-
-                # Collect words in this column
-                col_words = [text for x, text in sorted_words if x_start <= x < x_end]
-                row.append(" ".join(col_words))
-
-            # Skip header rows (check for actual header row, not just matching values)
-            if row:
-                matching_headers = sum(
-                    1
-                    for cell in row
-                    if any(h.lower() == str(cell).lower().strip() for h in headers)
-                )
-                non_empty = sum(1 for cell in row if str(cell).strip())
-                # Skip if more than half the cells are exact header matches
-                if non_empty > 0 and matching_headers > non_empty / 2:
-                    continue
-
-                rows.append(row)  # type: ignore[arg-type]
+        edges = column_edges(column_boundaries, num_columns, region["x_min"], region["x_max"])
+        split_rows: list[list[str]] = []
+        for _y_pos, sorted_words in word_rows:
+            row = split_row_columns(sorted_words, edges)
+
+            # Skip the header row itself (not rows that merely share a header value)
+            if row and not is_header_row(row, header_names):
+                split_rows.append(row)
 
         # Post-process: merge continuation rows (rows where first column is empty)
         # These are typically units or additional info on subsequent lines
-        merged_rows: list[list[str | int | float]] = []
-        for row in rows:  # type: ignore[assignment]
-            if merged_rows and not row[0]:
-                # Empty first column: merge with previous row
-                for col_idx in range(len(row)):
-                    if row[col_idx]:
-                        prev_val = merged_rows[-1][col_idx]
-                        merged_rows[-1][col_idx] = str(prev_val) + " " + str(row[col_idx])
-            else:
-                # Non-empty first column: new row
-                merged_rows.append(row)  # type: ignore[arg-type]
-        rows = merged_rows
+        rows = merge_continuation_rows(split_rows, strip=False)  # type: ignore[assignment]
 
     elif num_columns == 2:
         # Two-column table: use column_split_x if provided, otherwise midpoint
         split_x = config.get("column_split_x", (region["x_min"] + region["x_max"]) / 2)
-        for _y_pos, row_words in sorted(rows_dict.items()):
-            sorted_words = sorted(row_words, key=lambda w: w[0])
-            col1 = " ".join([text for x, text in sorted_words if x < split_x])
-            col2 = " ".join([text for x, text in sorted_words if x >= split_x])
+        edges = [-math.inf, split_x, math.inf]
+        for _y_pos, sorted_words in word_rows:
+            col1, col2 = split_row_columns(sorted_words, edges)
 
             if col1 and col2:
                 rows.append([col1, col2])
     else:
         # Multi-column without boundaries: concatenate all words as single row
-        for _y_pos, row_words in sorted(rows_dict.items()):
-            sorted_words = sorted(row_words, key=lambda w: w[0])
+        for _y_pos, sorted_words in word_rows:
             row_text = " ".join([text for _, text in sorted_words])
             if row_text:
                 rows.append([row_text])
@@ -4,13 +4,81 @@ Common operations extracted from text_table_parser.py to reduce duplication
 and provide reusable building blocks for coordinate-based PDF text extraction.
 """
 
+import math
+import os
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from itertools import groupby, pairwise
+from operator import itemgetter
+from pathlib import Path
 from typing import Any
 
-import fitz
+from ..utils.pdf_probe import shared_pdf
+
+# Currency denominations that end an equipment cost ("5 gp").
+CURRENCY_UNITS = frozenset({"gp", "sp", "cp"})
+
+
+def page_words(pdf_path: str | Path, page_num: int) -> tuple[tuple[Any, ...], ...]:
+    """Return ``page.get_text("words")`` for a page, memoized per PDF file.
+
+    Several tables share a page (page 72 alone carries four), so the word
+    list is extracted once per (pdf, page) and reused by every pattern that
+    reads it. The file's mtime is part of the cache key so a replaced PDF
+    is re-read rather than served stale.
+
+    Args:
+        pdf_path: Path to PDF file
+        page_num: Page number (1-indexed)
+
+    Returns:
+        Immutable tuple of (x0, y0, x1, y1, text) word tuples. PyMuPDF's
+        trailing block/line/word numbers are dropped before caching since
+        no caller reads them.
+    """
+    return _page_words(str(pdf_path), os.path.getmtime(pdf_path), page_num)
+
+
+@lru_cache(maxsize=128)
+def _page_words(pdf_path: str, mtime: float, page_num: int) -> tuple[tuple[Any, ...], ...]:
+    # Deliberately serial. PyMuPDF documents must not be shared across
+    # threads (MuPDF's context is not thread-safe and the bindings hold the
+    # GIL during get_text), so fanning multi-page tables out to a thread
+    # pool buys nothing and risks crashes. Multi-page tables are at most
+    # two pages, and repeat reads are already served from this cache.
+    words = shared_pdf(pdf_path)[page_num - 1].get_text("words")
+    return tuple(w[:5] for w in words)
+
+
+def clear_page_words() -> None:
+    """Drop every cached page word list (e.g. when a run closes its PDF)."""
+    _page_words.cache_clear()
+
+
+def _words_in_bounds(
+    words: Iterable[tuple[Any, ...]],
+    x_min: float | None,
+    x_max: float | None,
+    y_min: float | None,
+    y_max: float | None,
+) -> Iterator[tuple[float, float, str]]:
+    """Yield (x0, y0, text) for words with x_min <= x0 < x_max and y_min <= y0 < y_max.
+
+    Missing bounds become +/-inf up front, so each word costs one chained
+    comparison instead of four ``is not None`` tests.
+    """
+    lo_x = -math.inf if x_min is None else x_min
+    hi_x = math.inf if x_max is None else x_max
+    lo_y = -math.inf if y_min is None else y_min
+    hi_y = math.inf if y_max is None else y_max
+    for x0, y0, _x1, _y1, text, *_ in words:
+        if lo_x <= x0 < hi_x and lo_y <= y0 < hi_y:
+            yield x0, y0, text
 
 
 def group_words_by_y(
-    words: list[tuple[Any, ...]],
+    words: Iterable[tuple[Any, ...]],
     y_tolerance: float = 2.0,
     x_min: float | None = None,
     x_max: float | None = None,
@@ -32,28 +100,153 @@ def group_words_by_y(
     """
     rows: dict[float, list[tuple[float, str]]] = {}
 
-    for word in words:
-        x0, y0, x1, y1, text, *_ = word
-
-        # Apply coordinate filters
-        if x_min is not None and x0 < x_min:
-            continue
-        if x_max is not None and x0 >= x_max:
-            continue
-        if y_min is not None and y0 < y_min:
-            continue
-        if y_max is not None and y0 >= y_max:
-            continue
-
+    for x0, y0, text in _words_in_bounds(words, x_min, x_max, y_min, y_max):
         # Group by rounded Y-coordinate
         y_key = round(y0 / y_tolerance) * y_tolerance
-        if y_key not in rows:
-            rows[y_key] = []
-        rows[y_key].append((x0, text))
+        rows.setdefault(y_key, []).append((x0, text))
 
     return rows
 
 
+def sorted_word_rows(
+    words: Iterable[tuple[Any, ...]],
+    y_tolerance: float = 2.0,
+    x_min: float | None = None,
+    x_max: float | None = None,
+    y_min: float | None = None,
+    y_max: float | None = None,
+) -> Iterator[tuple[float, list[tuple[float, str]]]]:
+    """Group PDF words into rows, ordered top-to-bottom and left-to-right.
+
+    Same bucketing and filters as :func:`group_words_by_y`, but does a single
+    sort over (y_key, x) and slices rows off with ``groupby`` instead of
+    sorting the row keys and then every row separately. The sort is stable,
+    so words sharing an X keep their PDF order exactly as before.
+
+    Args:
+        words: Word tuples from page.get_text("words")
+        y_tolerance: Pixels within which words are considered on same row
+        x_min: Optional minimum X-coordinate filter
+        x_max: Optional maximum X-coordinate filter
+        y_min: Optional minimum Y-coordinate filter
+        y_max: Optional maximum Y-coordinate filter
+
+    Yields:
+        (Y-coordinate, [(X, text), ...]) per row, each row sorted by X. Rows
+        are produced lazily so callers that consume them once never hold a
+        second full copy of the region.
+    """
+    keyed = [
+        (round(y0 / y_tolerance) * y_tolerance, x0, text)
+        for x0, y0, text in _words_in_bounds(words, x_min, x_max, y_min, y_max)
+    ]
+
+    keyed.sort(key=itemgetter(0, 1))
+    for y_key, row in groupby(keyed, key=itemgetter(0)):
+        yield y_key, [(x, text) for _, x, text in row]
+
+
+def column_edges(
+    boundaries: list[float],
+    num_columns: int,
+    x_min: float,
+    x_max: float,
+    offset: float = 0,
+) -> list[float]:
+    """Turn a ``column_boundaries`` config into explicit column X edges.
+
+    Column ``i`` spans ``[edges[i], edges[i + 1])``: the first column starts
+    at ``x_min``, each boundary closes one column, and any column past the
+    last boundary runs to ``x_max``. ``offset`` is added to every boundary
+    (split_column configs give boundaries relative to the region's x_min).
+
+    Args:
+        boundaries: Column boundary X-coordinates from the table config
+        num_columns: Number of columns (headers) in the table
+        x_min: Left edge of the first column
+        x_max: Right edge used once boundaries run out
+        offset: Value added to each boundary
+
+    Returns:
+        ``num_columns + 1`` X edges
+    """
+    edges = [x_min]
+    for col_idx in range(num_columns):
+        edges.append(offset + boundaries[col_idx] if col_idx < len(boundaries) else x_max)
+    return edges
+
+
+def split_row_columns(sorted_words: list[tuple[float, str]], edges: list[float]) -> list[str]:
+    """Join an X-sorted row's words into one cell per column span.
+
+    The row is already ordered by X, so each edge is located with one binary
+    search and every column is a slice, instead of re-scanning the whole row
+    once per column. A word lands in column ``i`` exactly when
+    ``edges[i] <= x < edges[i + 1]``; words outside the outer edges are
+    dropped.
+
+    Args:
+        sorted_words: (X, text) tuples sorted by X
+        edges: Column edges, e.g. from :func:`column_edges`
+
+    Returns:
+        One space-joined cell per column (``len(edges) - 1`` cells)
+    """
+    xs = [x for x, _ in sorted_words]
+    cuts = [bisect_left(xs, edge) for edge in edges]
+    return [" ".join([text for _, text in sorted_words[lo:hi]]) for lo, hi in pairwise(cuts)]
+
+
+def is_header_row(row: list[str], header_names: set[str]) -> bool:
+    """Check whether a split row is the table's own header row.
+
+    Values such as "1st"/"2nd" appear both as Level cells and as spell-slot
+    headers, so a single matching cell is not enough: the row counts as a
+    header only when more than half of its non-empty cells equal a header
+    name exactly.
+
+    Args:
+        row: Cell strings for one row
+        header_names: Lowercased header names
+
+    Returns:
+        True if the row should be skipped as a header
+    """
+    matching_headers = sum(1 for cell in row if cell.lower().strip() in header_names)
+    non_empty = sum(1 for cell in row if cell.strip())
+    return non_empty > 0 and matching_headers > non_empty / 2
+
+
+def merge_continuation_rows(rows: list[list[str]], strip: bool = True) -> list[list[str]]:
+    """Fold rows with an empty first cell into the row above.
+
+    Wrapped names, units and trailing notes land on their own PDF line with
+    nothing in the first column; each non-empty cell is appended to the
+    same column of the previous row.
+
+    Args:
+        rows: Split rows in reading order (the kept rows are updated in place)
+        strip: Treat whitespace-only cells as empty (``False`` checks plain
+            truthiness, as text_region always has)
+
+    Returns:
+        Rows with continuation lines merged
+    """
+    merged_rows: list[list[str]] = []
+    for row in rows:
+        first = row[0].strip() if strip else row[0]
+        if merged_rows and not first:
+            # Empty first column: merge with previous row
+            previous = merged_rows[-1]
+            for col_idx, cell in enumerate(row):
+                if cell.strip() if strip else cell:
+                    previous[col_idx] = previous[col_idx] + " " + cell
+        else:
+            # Non-empty first column: new row
+            merged_rows.append(row)
+    return merged_rows
+
+
 def extract_region_rows(
     pdf_path: str,
     page_num: int,
@@ -77,10 +270,7 @@ def extract_region_rows(
     Returns:
         Dictionary mapping Y-coordinate to list of (X, text) tuples
     """
-    doc = fitz.open(pdf_path)
-    page = doc[page_num - 1]
-    words = page.get_text("words")
-    doc.close()
+    words = page_words(pdf_path, page_num)
 
     return group_words_by_y(words, y_tolerance, x_min, x_max, y_min, y_max)
 
@@ -95,7 +285,7 @@ def find_currency_index(words: list[str]) -> int | None:
         Index of currency word, or None if not found
     """
     for i, word in enumerate(words):
-        if word in ["gp", "sp", "cp"]:
+        if word in CURRENCY_UNITS:
             return i
     return None
 
@@ -111,7 +301,15 @@ def split_at_currency(words: list[str], currency_idx: int) -> tuple[list[str], s
 
     Returns:
         Tuple of (name_parts, cost_with_currency, remaining_parts)
+
+    Raises:
+        ValueError: If the currency word is first, so there is no amount
     """
+    # Index 0 is a valid find_currency_index() result, but words[-1] would
+    # silently become the "amount"; callers must test ``is not None``.
+    if currency_idx < 1:
+        raise ValueError(f"Currency word at index {currency_idx} has no amount before it")
+
     # Name: everything before cost amount
     name_parts = words[: currency_idx - 1]
 
@@ -185,10 +383,11 @@ def rows_to_sorted_text(
     Returns:
         List of (Y-coordinate, sorted_words) tuples, ordered by Y (top to bottom)
     """
+    by_x = itemgetter(0)
     result = []
-    for y_pos in sorted(rows.keys()):
-        # Sort words by X-coordinate (left to right)
-        row_words = sorted(rows[y_pos], key=lambda w: w[0])
+    for y_pos in sorted(rows):
+        # Sort words by X-coordinate (left to right); copy so callers' rows stay as-is
+        row_words = sorted(rows[y_pos], key=by_x)
         words_list = [text for x, text in row_words]
         result.append((y_pos, words_list))
     return result
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import json
-from collections import OrderedDict
+import os
+from functools import cache
 from pathlib import Path
 from typing import Any
 
 from .. import __version__
 from ..constants import RULESETS
-from .page_index import PAGE_INDEX
+from .page_index import PAGE_INDEX, Section
 
 # Schema directory location
 SCHEMA_DIR = Path(__file__).resolve().parents[3] / "schemas"
@@ -108,21 +109,27 @@ def _compute_extraction_status(
             "weapon_properties": "complete",
         }
 
-    # Check actual file existence
-    # Keep in alphabetical order for consistency in meta.json output
-    datasets = ALL_DATASETS
-
-    status = {}
-    for dataset in datasets:
-        file_path = dist_dir / f"{dataset}.json"
-        status[dataset] = "complete" if file_path.exists() else "in_progress"
+    # Check actual file existence with one directory listing, not a stat per dataset
+    try:
+        with os.scandir(dist_dir) as entries:
+            existing = {entry.name for entry in entries}
+    except FileNotFoundError:
+        existing = set()
 
-    return status
+    # Keep in alphabetical order for consistency in meta.json output
+    return {
+        dataset: "complete" if f"{dataset}.json" in existing else "in_progress"
+        for dataset in ALL_DATASETS
+    }
 
 
+@cache
 def read_schema_version(schema_name: str) -> str:
     """Read version from a schema file.
 
+    Cached per schema name for the life of the process (schemas do not change
+    mid-build); tests that rewrite schema files call ``cache_clear()``.
+
     Args:
         schema_name: Name of schema (e.g., 'monster', 'spell', 'equipment')
 
@@ -279,8 +286,9 @@ def wrap_with_meta(
     Forwards all provenance kwargs to :func:`meta_block`; see there for
     field semantics.
     """
-    document: OrderedDict[str, Any] = OrderedDict()
-    document["_meta"] = meta_block(
+    # Plain dicts keep insertion order, so "_meta" leads; the payload is merged
+    # with one C-level update instead of a per-key copy into an OrderedDict.
+    meta = meta_block(
         ruleset,
         schema_version,
         dataset=dataset,
@@ -290,9 +298,7 @@ def wrap_with_meta(
         item_count=item_count,
         extraction_warnings=extraction_warnings,
     )
-    for key, value in payload.items():
-        document[key] = value
-    return document
+    return {"_meta": meta, **payload}
 
 
 def derive_source_pages(records: list[dict[str, Any]]) -> str | None:
@@ -325,6 +331,25 @@ def derive_source_pages(records: list[dict[str, Any]]) -> str | None:
     return str(lo) if lo == hi else f"{lo}-{hi}"
 
 
+def _page_index_entry(section: Section) -> dict[str, int | str]:
+    """Flatten one PAGE_INDEX section into its meta.json page_index shape."""
+    entry: dict[str, int | str] = {
+        "start": section["pages"]["start"],
+        "end": section["pages"]["end"],
+        "description": section["description"],
+    }
+    dataset = section.get("dataset")
+    if dataset is not None:
+        entry["dataset"] = dataset
+    return entry
+
+
+# PAGE_INDEX is static, so its flattened form is built once at import.
+_BASE_PAGE_INDEX: dict[str, dict[str, int | str]] = {
+    section_name: _page_index_entry(section) for section_name, section in PAGE_INDEX.items()
+}
+
+
 def build_page_index(
     *,
     monsters_page_range: tuple[int, int] | None,
@@ -334,18 +359,8 @@ def build_page_index(
 ) -> dict[str, Any]:
     """Build page_index section for meta.json."""
 
-    page_index: dict[str, dict[str, int | str]] = {}
-
-    for section_name, section in PAGE_INDEX.items():
-        section_data: dict[str, int | str] = {
-            "start": section["pages"]["start"],
-            "end": section["pages"]["end"],
-            "description": section["description"],
-        }
-        dataset = section.get("dataset")
-        if dataset is not None:
-            section_data["dataset"] = dataset
-        page_index[section_name] = section_data
+    # Shallow-copy each section so callers can mutate the result safely
+    page_index: dict[str, Any] = {name: dict(entry) for name, entry in _BASE_PAGE_INDEX.items()}
 
     if table_page_index and "reference_tables" in table_page_index:
         page_index["reference_tables"] = table_page_index["reference_tables"]
@@ -21,6 +21,7 @@ numbers via utils.page_index.PAGE_INDEX, which is 1-based.
 from __future__ import annotations
 
 import hashlib
+import os
 import re
 from collections.abc import Callable, Iterator, Sequence
 from contextlib import contextmanager
@@ -55,6 +56,42 @@ def open_pdf(pdf_path: Path) -> Iterator[fitz.Document]:
         doc.close()
 
 
+# Process-wide read-only handles, keyed by path and tagged with the mtime
+# they were opened at. See shared_pdf().
+_shared_docs: dict[str, tuple[float, fitz.Document]] = {}
+
+
+def shared_pdf(pdf_path: Path | str) -> fitz.Document:
+    """Return a long-lived, shared Document for ``pdf_path``.
+
+    Opening a PDF parses its xref, catalog and page tree; the table engine
+    reads dozens of pages from the same file in one run, so it borrows this
+    handle instead of reopening per page. Callers must not close it — call
+    :func:`close_shared_pdfs` at the end of a run. A changed mtime reopens
+    the file.
+    """
+    key = str(pdf_path)
+    mtime = os.path.getmtime(key)
+    cached = _shared_docs.get(key)
+    if cached is not None:
+        if cached[0] == mtime:
+            return cached[1]
+        cached[1].close()
+
+    import fitz
+
+    doc = fitz.open(key)
+    _shared_docs[key] = (mtime, doc)
+    return doc
+
+
+def close_shared_pdfs() -> None:
+    """Close every handle handed out by :func:`shared_pdf`."""
+    while _shared_docs:
+        _, (_, doc) = _shared_docs.popitem()
+        doc.close()
+
+
 def page_text(doc: fitz.Document, pdf_index: int, *, normalize: bool = True) -> str:
     """Return text for a single page (0-based PDF index)."""
     raw = doc.load_page(pdf_index).get_text("text")
@@ -91,13 +128,14 @@ def srd_page_to_pdf_index(srd_page: int) -> int:
     return srd_page - 1
 
 
-def pdf_sha256(pdf_path: Path, *, chunk_size: int = 8192) -> str:
-    """Return hex SHA-256 of ``pdf_path`` for provenance/determinism stamps."""
-    sha256 = hashlib.sha256()
+def pdf_sha256(pdf_path: Path) -> str:
+    """Return hex SHA-256 of ``pdf_path`` for provenance/determinism stamps.
+
+    ``hashlib.file_digest`` reads in large buffers and hashes in C without
+    holding the whole PDF in memory.
+    """
     with open(pdf_path, "rb") as fh:
-        for chunk in iter(lambda: fh.read(chunk_size), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+        return hashlib.file_digest(fh, "sha256").hexdigest()
 
 
 def concat_pages_with_offsets(
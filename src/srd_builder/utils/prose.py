@@ -9,8 +9,11 @@ Use these helpers in your extract_*.py modules to reduce boilerplate.
 from __future__ import annotations
 
 import re
+from pathlib import Path
 from typing import Any
 
+import fitz
+
 # Import shared text cleaning utility to avoid duplication
 from ..postprocess.text import clean_text, collapse_soft_hyphen_runs, strip_srd_page_footer
 
@@ -379,10 +382,6 @@ class ProseExtractor:
         Returns:
             Tuple of (sections list, warnings list)
         """
-        from pathlib import Path
-
-        import fitz
-
         # Handle both path and open document
         if isinstance(pdf_path, str | Path):
             doc = fitz.open(str(pdf_path))
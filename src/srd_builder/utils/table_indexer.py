@@ -12,14 +12,19 @@ into v0.7.0 alongside reference table extraction.
 from __future__ import annotations
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
-
-import fitz  # PyMuPDF
+from typing import TYPE_CHECKING, Any
 
 from ..constants import EXTRACTOR_VERSION
 
+if TYPE_CHECKING:
+    import fitz  # PyMuPDF
+
+    from ..extract.table_targets import TableTarget
+
 logger = logging.getLogger(__name__)
 
 # Table detection constants
@@ -27,11 +32,36 @@ MIN_TABLE_ROWS = 2  # Minimum rows required (header + at least one data row)
 SECTION_HEADER_SIZE = 18.0  # Font size for section headers (18pt+)
 MIN_SECTION_HEADER_LENGTH = 3  # Minimum text length for section headers
 MIN_KEYWORD_MATCHES = 2  # Minimum keyword matches to identify table
-
-
-@dataclass
+EQUIPMENT_PAGES = frozenset(range(62, 74))  # Pages 62-73 (1-indexed)
+
+# Header keywords for known tables, checked in order by _estimate_table_id().
+# Matching is by substring, so e.g. "ac" also hits "space".
+TABLE_ID_KEYWORDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("experience_by_cr", ("challenge", "rating", "xp", "experience")),
+    ("proficiency_bonus", ("level", "proficiency", "bonus")),
+    ("ability_scores", ("ability", "score", "modifier")),
+    ("spell_slots", ("level", "slot", "1st", "2nd", "3rd")),
+    ("cantrip_damage", ("cantrip", "damage", "level")),
+    ("travel_pace", ("pace", "distance", "hour", "day")),
+    ("services", ("service", "cost", "pay")),
+    ("creature_size", ("size", "space", "category")),
+    ("armor", ("armor", "cost", "ac", "class")),
+    ("weapon", ("weapon", "damage", "properties")),
+)
+
+# Parallel discovery: find_tables() is CPU-bound, so page ranges this long are
+# split across worker processes (each opens its own document handle).
+MAX_DISCOVERY_WORKERS = 4
+MIN_PAGES_FOR_WORKERS = 16
+
+
+@dataclass(slots=True, frozen=True)
 class TableMetadata:
-    """Metadata for a discovered table."""
+    """Metadata for a discovered table.
+
+    Slotted and immutable: a full-PDF scan creates one per table, and the
+    instances are pickled back from discovery worker processes.
+    """
 
     page: int
     table_index: int  # Index on page (0-based)
@@ -70,6 +100,34 @@ class TableIndexer:
 
         self.pdf_path = pdf_path
         self.tables: list[TableMetadata] = []
+        self._doc: fitz.Document | None = None
+        # Section context per 0-indexed page; re-scans of overlapping ranges reuse it
+        self._section_context: dict[int, str | None] = {}
+
+    @property
+    def doc(self) -> fitz.Document:
+        """PDF handle, opened on first use and kept open until close()."""
+        if self._doc is None:
+            # PyMuPDF is imported on first scan rather than at module import
+            import fitz
+
+            self._doc = fitz.open(self.pdf_path)
+        return self._doc
+
+    def close(self) -> None:
+        """Close the PDF document and drop per-page caches."""
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+        self._section_context.clear()
+
+    def __enter__(self) -> TableIndexer:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Context manager exit."""
+        self.close()
 
     def discover_all_tables(
         self,
@@ -77,6 +135,7 @@ class TableIndexer:
         end_page: int | None = None,
         include_equipment: bool = True,
         use_auto_detection: bool = True,
+        workers: int | None = None,
     ) -> list[TableMetadata]:
         """Scan PDF and catalog all tables.
 
@@ -85,9 +144,12 @@ class TableIndexer:
             end_page: Ending page (1-indexed), None = end of document
             include_equipment: Whether to include equipment tables (pages 62-73)
             use_auto_detection: Use PyMuPDF auto-detection (may miss simple tables)
+            workers: Worker processes for the page scan, None = min(cpu_count, 4).
+                Ranges shorter than MIN_PAGES_FOR_WORKERS are always scanned
+                in-process.
 
         Returns:
-            List of table metadata entries
+            List of table metadata entries, in page order
 
         Note:
             PyMuPDF's find_tables() works well for grid-based tables but often
@@ -97,40 +159,84 @@ class TableIndexer:
         """
         logger.info(f"Discovering tables in {self.pdf_path}")
 
-        doc = fitz.open(self.pdf_path)
+        # The document stays open on the indexer (see close()) so repeated
+        # scans do not pay the open/xref/font setup again.
+        doc = self.doc
         self.tables = []
 
-        try:
-            # Determine page range
-            start = (start_page - 1) if start_page else 0
-            end = end_page if end_page else len(doc)
+        # Determine page range
+        start = (start_page - 1) if start_page else 0
+        end = end_page if end_page else len(doc)
+        pages = range(start, end)
+
+        logger.info(f"Scanning pages {start + 1} to {end}")
 
-            logger.info(f"Scanning pages {start + 1} to {end}")
+        if workers is None:
+            workers = min(os.cpu_count() or 1, MAX_DISCOVERY_WORKERS)
 
-            for page_num in range(start, end):
-                page = doc[page_num]
+        # Equipment pages are skipped before find_tables(), not filtered afterwards
+        skip_pages: frozenset[int] = frozenset() if include_equipment else EQUIPMENT_PAGES
 
-                if use_auto_detection:
-                    page_tables = self._discover_page_tables(page, page_num + 1)
-                else:
-                    page_tables = []
+        if not use_auto_detection:
+            self.tables = []
+        elif workers > 1 and len(pages) >= MIN_PAGES_FOR_WORKERS:
+            self.tables = self._discover_pages_parallel(pages, workers, skip_pages)
+        else:
+            self.tables = self._discover_pages(pages, skip_pages)
 
-                # Filter equipment tables if requested
-                if not include_equipment:
-                    equipment_pages = set(range(62, 74))  # Pages 62-73 (1-indexed)
-                    page_tables = [t for t in page_tables if t.page not in equipment_pages]
+        logger.info(
+            f"Discovered {len(self.tables)} tables "
+            f"(auto-detection={'enabled' if use_auto_detection else 'disabled'})"
+        )
 
-                self.tables.extend(page_tables)
+        return self.tables
 
-            logger.info(
-                f"Discovered {len(self.tables)} tables "
-                f"(auto-detection={'enabled' if use_auto_detection else 'disabled'})"
-            )
+    def _discover_pages(
+        self, pages: range, skip_pages: frozenset[int] = frozenset()
+    ) -> list[TableMetadata]:
+        """Discover tables on each page of ``pages`` (0-indexed) in order.
 
-        finally:
-            doc.close()
+        ``skip_pages`` holds 1-indexed page numbers that are not scanned at all.
+        """
+        # Document.pages() steps backwards when start > stop and rejects a start
+        # past the last page, so clamp to the document and bail out on an empty
+        # range before it gets there.
+        start, stop = max(pages.start, 0), min(pages.stop, len(self.doc))
+        if start >= stop:
+            return []
+
+        tables: list[TableMetadata] = []
+        # Document.pages() walks the range once instead of resolving doc[n] per page
+        for page_num, page in enumerate(self.doc.pages(start, stop), start + 1):
+            if page_num in skip_pages:
+                continue
+            tables.extend(self._discover_page_tables(page, page_num))
+        return tables
+
+    def _discover_pages_parallel(
+        self, pages: range, workers: int, skip_pages: frozenset[int] = frozenset()
+    ) -> list[TableMetadata]:
+        """Split ``pages`` into contiguous chunks and scan them in worker processes.
 
-        return self.tables
+        fitz documents cannot be pickled, so each worker opens its own handle.
+        Chunks are contiguous and ``map`` keeps submission order, so the
+        concatenated result is in the same page order as a serial scan.
+        """
+        chunk_size = -(-len(pages) // workers)  # ceil division
+        chunks = [pages[i : i + chunk_size] for i in range(0, len(pages), chunk_size)]
+
+        logger.info(f"Scanning {len(pages)} pages with {len(chunks)} worker processes")
+
+        tables: list[TableMetadata] = []
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            for chunk_tables in pool.map(
+                _discover_page_chunk,
+                [self.pdf_path] * len(chunks),
+                chunks,
+                [skip_pages] * len(chunks),
+            ):
+                tables.extend(chunk_tables)
+        return tables
 
     def _discover_page_tables(self, page: fitz.Page, page_num: int) -> list[TableMetadata]:
         """Discover all tables on a single page.
@@ -147,21 +253,29 @@ class TableIndexer:
         try:
             table_finder = page.find_tables()
 
-            # Get section context from page headers
-            section_context = self._extract_section_context(page)
+            # Section context (a full-page text walk) is only read once the page
+            # has a table worth recording; table-less pages never pay for it.
+            section_context: str | None = None
+            have_context = False
 
             for table_idx, table in enumerate(table_finder.tables):
-                rows = table.extract()
-
-                if not rows or len(rows) < MIN_TABLE_ROWS:  # Need at least header + 1 data row
+                # row_count is known from detection; extract() then scans the page's
+                # characters once per row, so reject short tables before paying for it
+                if table.row_count < MIN_TABLE_ROWS:  # Need at least header + 1 data row
                     continue
 
+                rows = table.extract()
+
                 # Extract headers (first row)
                 headers = [str(cell).strip() for cell in rows[0]]
 
                 # Determine column count
                 column_count = len(headers)
 
+                if not have_context:
+                    section_context = self._extract_section_context(page)
+                    have_context = True
+
                 # Create metadata entry
                 metadata = TableMetadata(
                     page=page_num,
@@ -198,8 +312,21 @@ class TableIndexer:
         Returns:
             Section name or None
         """
+        if page.number in self._section_context:
+            return self._section_context[page.number]
+
+        section = self._scan_section_context(page)
+        self._section_context[page.number] = section
+        return section
+
+    def _scan_section_context(self, page: fitz.Page) -> str | None:
+        """Uncached body of _extract_section_context."""
+        import fitz
+
         try:
-            blocks = page.get_text("dict")["blocks"]
+            # Image blocks are skipped below, so don't have MuPDF decode them
+            flags = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+            blocks = page.get_text("dict", flags=flags)["blocks"]
 
             for block in blocks:
                 if block.get("type") != 0:  # Only text blocks
@@ -207,11 +334,12 @@ class TableIndexer:
 
                 for line in block.get("lines", []):
                     for span in line.get("spans", []):
-                        size = span.get("size", 0)
+                        # Large headers (18pt+) are usually section markers;
+                        # test the size before stripping body-sized spans
+                        if span.get("size", 0) < SECTION_HEADER_SIZE:
+                            continue
                         text = span.get("text", "").strip()
-
-                        # Large headers (18pt+) are usually section markers
-                        if size >= SECTION_HEADER_SIZE and len(text) > MIN_SECTION_HEADER_LENGTH:
+                        if len(text) > MIN_SECTION_HEADER_LENGTH:
                             return text
 
         except Exception as e:
@@ -233,28 +361,16 @@ class TableIndexer:
             return None
 
         # Normalize headers for matching
-        normalized = [h.lower().strip() for h in headers]
-        header_text = " ".join(normalized)
-
-        # Pattern matching for known tables
-        patterns = {
-            "experience_by_cr": ["challenge", "rating", "xp", "experience"],
-            "proficiency_bonus": ["level", "proficiency", "bonus"],
-            "ability_scores": ["ability", "score", "modifier"],
-            "spell_slots": ["level", "slot", "1st", "2nd", "3rd"],
-            "cantrip_damage": ["cantrip", "damage", "level"],
-            "travel_pace": ["pace", "distance", "hour", "day"],
-            "services": ["service", "cost", "pay"],
-            "creature_size": ["size", "space", "category"],
-            "armor": ["armor", "cost", "ac", "class"],
-            "weapon": ["weapon", "damage", "properties"],
-        }
+        header_text = " ".join([h.lower().strip() for h in headers])
 
-        for table_id, keywords in patterns.items():
-            # Check if multiple keywords appear in headers
-            matches = sum(1 for kw in keywords if kw in header_text)
-            if matches >= MIN_KEYWORD_MATCHES:  # At least 2 keywords match
-                return table_id
+        for table_id, keywords in TABLE_ID_KEYWORDS:
+            # Check if multiple keywords appear in headers; stop counting at the threshold
+            matches = 0
+            for kw in keywords:
+                if kw in header_text:
+                    matches += 1
+                    if matches >= MIN_KEYWORD_MATCHES:  # At least 2 keywords match
+                        return table_id
 
         return None
 
@@ -264,24 +380,23 @@ class TableIndexer:
         Returns:
             Dictionary with statistics and table list
         """
-        # Group tables by page
-        by_page: dict[int, list[TableMetadata]] = {}
-        for table in self.tables:
-            by_page.setdefault(table.page, []).append(table)
-
-        # Group by estimated ID
-        by_id: dict[str, list[TableMetadata]] = {}
+        # Count tables per page and per estimated ID, and serialise, in one pass
+        by_page: dict[int, int] = {}
+        by_id: dict[str, int] = {}
+        tables: list[dict[str, Any]] = []
         for table in self.tables:
+            by_page[table.page] = by_page.get(table.page, 0) + 1
             table_id = table.estimated_id or "unknown"
-            by_id.setdefault(table_id, []).append(table)
+            by_id[table_id] = by_id.get(table_id, 0) + 1
+            tables.append(table.to_dict())
 
         return {
             "total_tables": len(self.tables),
             "pages_with_tables": len(by_page),
-            "page_range": ((min(by_page.keys()), max(by_page.keys())) if by_page else (0, 0)),
-            "tables_by_page": {page: len(tables) for page, tables in sorted(by_page.items())},
-            "tables_by_id": {table_id: len(tables) for table_id, tables in sorted(by_id.items())},
-            "tables": [t.to_dict() for t in self.tables],
+            "page_range": ((min(by_page), max(by_page)) if by_page else (0, 0)),
+            "tables_by_page": dict(sorted(by_page.items())),
+            "tables_by_id": dict(sorted(by_id.items())),
+            "tables": tables,
         }
 
     def generate_page_index_for_meta(
@@ -329,28 +444,17 @@ class TableIndexer:
 
         # Add reference tables from target list
         reference_tables: list[dict[str, str]] = []
+        # Set once, so the per-target "was it extracted?" test is O(1)
+        extracted = frozenset(extracted_table_ids) if extracted_table_ids is not None else None
         try:
             from srd_builder.extract.table_targets import TARGET_TABLES
 
-            for target in TARGET_TABLES:
-                # Skip tables that weren't successfully extracted
-                if extracted_table_ids is not None and target["id"] not in extracted_table_ids:
-                    continue
-
-                page = target["page"]
-                if isinstance(page, list):
-                    page_str = f"{page[0]}-{page[-1]}"
-                else:
-                    page_str = str(page)
-
-                reference_tables.append(
-                    {
-                        "id": target["id"],
-                        "name": target["name"],
-                        "page": page_str,
-                        "category": target["category"],
-                    }
-                )
+            # Skip tables that weren't successfully extracted
+            reference_tables = [
+                _reference_table_entry(target)
+                for target in TARGET_TABLES
+                if extracted is None or target["id"] in extracted
+            ]
         except ImportError:
             logger.warning("Could not import TARGET_TABLES for page index")
 
@@ -370,8 +474,10 @@ class TableIndexer:
         """
         discovered_pages = {t.page for t in self.tables}
 
-        found = [p for p in target_pages if p in discovered_pages]
-        missing = [p for p in target_pages if p not in discovered_pages]
+        found: list[int] = []
+        missing: list[int] = []
+        for p in target_pages:
+            (found if p in discovered_pages else missing).append(p)
 
         return {
             "found": sorted(found),
@@ -402,6 +508,26 @@ class TableIndexer:
         logger.info(f"Saved table metadata to {output_path}")
 
 
+def _reference_table_entry(target: TableTarget) -> dict[str, str]:
+    """Page-index entry for one target table; multi-page ranges read "first-last"."""
+    page = target["page"]
+    page_str = f"{page[0]}-{page[-1]}" if isinstance(page, list) else str(page)
+    return {
+        "id": target["id"],
+        "name": target["name"],
+        "page": page_str,
+        "category": target["category"],
+    }
+
+
+def _discover_page_chunk(
+    pdf_path: Path, pages: range, skip_pages: frozenset[int]
+) -> list[TableMetadata]:
+    """Process-pool worker: scan one chunk of pages with a private document."""
+    with TableIndexer(pdf_path) as indexer:
+        return indexer._discover_pages(pages, skip_pages)
+
+
 def discover_tables(
     pdf_path: Path,
     start_page: int | None = None,
@@ -419,9 +545,9 @@ def discover_tables(
     Returns:
         Report dictionary with table metadata
     """
-    indexer = TableIndexer(pdf_path)
-    indexer.discover_all_tables(start_page, end_page, include_equipment)
-    return indexer.generate_report()
+    with TableIndexer(pdf_path) as indexer:
+        indexer.discover_all_tables(start_page, end_page, include_equipment)
+        return indexer.generate_report()
 
 
 if __name__ == "__main__":
@@ -484,4 +610,5 @@ if __name__ == "__main__":
     # Save full report
     output_path = Path("table_metadata.json")
     indexer.save_metadata(output_path)
+    indexer.close()
     print(f"\nFull metadata saved to {output_path}")
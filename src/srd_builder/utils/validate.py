@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import argparse
-import hashlib
 import json
+import os
 import sys
 from collections import defaultdict
 from collections.abc import Iterable
+from functools import lru_cache
 from itertools import islice
 from pathlib import Path
 from typing import Any
@@ -15,11 +16,17 @@ from typing import Any
 from jsonschema import Draft202012Validator
 
 from ..constants import DIST_DIRNAME, RULESETS_DIRNAME, SCHEMAS_DIRNAME
+from .pdf_probe import pdf_sha256
 
 SCHEMA_DIR = Path(__file__).resolve().parents[3] / SCHEMAS_DIRNAME
 DIST_DIR = Path(__file__).resolve().parents[3] / DIST_DIRNAME
 RULESETS_DIR = Path(__file__).resolve().parents[3] / RULESETS_DIRNAME
 
+# Opt-in sidecar (--reuse-pdf-hash) next to pdf_meta.json remembering the last
+# computed PDF digest, keyed on the file's path, size and mtime so an unchanged
+# PDF is not rehashed during local iteration.
+PDF_HASH_CACHE_NAME = "pdf_meta.cache.json"
+
 # Maps every emitted dataset filename to the schema stem (file without .schema.json)
 # that defines its item shape. Every dataset shipped in dist/<ruleset>/ MUST appear
 # here, otherwise the strict validator silently skips it.
@@ -47,6 +54,26 @@ def load_json(path: Path) -> Any:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
+def compiled_validator(schema_path: Path) -> Draft202012Validator:
+    """Return a schema-checked validator for ``schema_path``, built once per file.
+
+    Every dataset run (and the bundle/repo passes over the same schema dir)
+    reuses one validator per schema instead of re-parsing the JSON and
+    rebuilding the validator. The file's mtime is part of the cache key so
+    an edited schema is picked up rather than served stale.
+    """
+    return _compiled_validator(str(schema_path), schema_path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=64)
+def _compiled_validator(schema_path: str, mtime_ns: int) -> Draft202012Validator:
+    schema = load_json(Path(schema_path))
+    # Reject a malformed schema once, up front, instead of surfacing it as
+    # confusing per-item errors.
+    Draft202012Validator.check_schema(schema)
+    return Draft202012Validator(schema)
+
+
 def _categorize_error(err: Any) -> str:
     """Build a stable category key from a jsonschema ValidationError."""
     path = ".".join(str(p) for p in err.absolute_path) or "<root>"
@@ -81,8 +108,7 @@ def validate_one_dataset(
         report["status"] = "BAD_SHAPE"
         return report
 
-    schema = load_json(schema_path)
-    validator = Draft202012Validator(schema)
+    validator = compiled_validator(schema_path)
 
     iterable: Iterable[Any] = items
     if limit is not None:
@@ -93,15 +119,19 @@ def validate_one_dataset(
     total = 0
     failed = 0
 
+    iter_errors = validator.iter_errors
     for item in iterable:
         total += 1
         if not isinstance(item, dict):
             continue
-        item_errors = list(validator.iter_errors(item))
-        if item_errors:
+        # Valid items (the common case) stop at the first next(); only failing
+        # items drain the rest, since the report lists every error.
+        errors = iter_errors(item)
+        first_error = next(errors, None)
+        if first_error is not None:
             failed += 1
             item_id = str(item.get("id", "<no-id>"))
-            for err in item_errors:
+            for err in (first_error, *errors):
                 cat = _categorize_error(err)
                 categories[cat] += 1
                 errors_list.append(
@@ -272,7 +302,48 @@ def _ensure_build_report(ruleset: str) -> None:
     print(f"OK: build_report.json present for {ruleset} at {report_path}.")
 
 
-def _check_pdf_hash(ruleset: str) -> None:
+def _cached_pdf_sha256(pdf_path: Path) -> str:
+    """Return the PDF's SHA-256, reusing the sidecar digest when the file is unchanged.
+
+    The sidecar is trusted only while path, size and mtime_ns all match, so
+    an ordinary rewrite of the PDF forces a fresh hash. That check can be
+    fooled by tools that preserve or copy mtimes (``cp -p``, ``rsync -t``,
+    ``touch -r``), which is why it is only used on request. A read-only raw
+    directory just means the digest is not cached.
+    """
+    cache_path = pdf_path.parent / PDF_HASH_CACHE_NAME
+    stat = pdf_path.stat()
+    key = {"path": str(pdf_path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    try:
+        cached = load_json(cache_path)
+    except OSError, ValueError:
+        cached = None
+    if (
+        isinstance(cached, dict)
+        and isinstance(cached.get("pdf_sha256"), str)
+        and all(cached.get(field) == value for field, value in key.items())
+    ):
+        return str(cached["pdf_sha256"])
+
+    digest = pdf_sha256(pdf_path)
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        tmp_path.write_text(
+            json.dumps({**key, "pdf_sha256": digest}, indent=2) + "\n", encoding="utf-8"
+        )
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+    return digest
+
+
+def _check_pdf_hash(ruleset: str, *, reuse_hash_cache: bool = False) -> None:
+    """Check the raw PDF against the digest recorded in pdf_meta.json.
+
+    The PDF is hashed in full every time unless ``reuse_hash_cache`` is set,
+    in which case :func:`_cached_pdf_sha256` may reuse a sidecar digest.
+    """
     raw_dir = RULESETS_DIR / ruleset / "raw"
     pdf_files = sorted(raw_dir.glob("*.pdf")) if raw_dir.exists() else []
 
@@ -293,7 +364,7 @@ def _check_pdf_hash(ruleset: str) -> None:
             raise TypeError("pdf_meta.json pdf_sha256 must be a string")
 
         pdf_path = pdf_files[0]
-        computed_hash = hashlib.sha256(pdf_path.read_bytes()).hexdigest()
+        computed_hash = _cached_pdf_sha256(pdf_path) if reuse_hash_cache else pdf_sha256(pdf_path)
         if computed_hash != recorded_hash:
             raise ValueError(
                 "PDF hash mismatch: pdf_meta.json pdf_sha256 does not match the current file"
@@ -312,6 +383,7 @@ def validate_ruleset(
     strict: bool = True,
     schema_source: str = "bundle",
     report_path: Path | None = None,
+    reuse_pdf_hash: bool = False,
 ) -> dict[str, Any]:
     """Run the full validation suite for a ruleset bundle.
 
@@ -319,9 +391,11 @@ def validate_ruleset(
     ``SystemExit(1)`` after a full report has been printed. This is the
     producer-side gate: emitted data MUST conform to its shipped schemas.
     Pass ``strict=False`` for report-only mode during iteration.
+    ``reuse_pdf_hash=True`` lets the PDF hash check trust a size+mtime sidecar
+    instead of rehashing an unchanged PDF (local iteration only).
     """
     _ensure_build_report(ruleset)
-    _check_pdf_hash(ruleset)
+    _check_pdf_hash(ruleset, reuse_hash_cache=reuse_pdf_hash)
 
     report = validate_all_datasets(ruleset, schema_source=schema_source, limit=limit)
     print(render_report(report))
@@ -371,6 +445,14 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=None,
         help="Write a machine-readable JSON report (dataset/id/category/path/message) to this path",
     )
+    parser.add_argument(
+        "--reuse-pdf-hash",
+        action="store_true",
+        help=(
+            f"Reuse the PDF digest cached in raw/{PDF_HASH_CACHE_NAME} while the PDF's "
+            "size and mtime are unchanged (faster local runs; not for release checks)"
+        ),
+    )
     return parser.parse_args(argv)
 
 
@@ -383,6 +465,7 @@ def main(argv: list[str] | None = None) -> int:
             strict=not args.report_only,
             schema_source=args.schema_source,
             report_path=args.report,
+            reuse_pdf_hash=args.reuse_pdf_hash,
         )
     except SystemExit as exc:
         if isinstance(exc.code, str):
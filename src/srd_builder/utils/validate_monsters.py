@@ -70,12 +70,17 @@ def validate_category_completeness(monsters: list[dict[str, Any]]) -> dict[str,
             }
         }
     """
-    names = [m["name"] for m in monsters]
+    # One NUL-separated haystack: "e in names_joined" is the same test as
+    # any(e in n for n in names) (names never contain NUL) but runs as a
+    # single C-level substring search instead of a Python loop per name.
+    names_joined = "\x00".join(m["name"] for m in monsters)
     results = {}
 
     for category, expected in EXPECTED_CATEGORIES.items():
-        found = [e for e in expected if any(e in n for n in names)]
-        missing = [e for e in expected if not any(e in n for n in names)]
+        found: list[str] = []
+        missing: list[str] = []
+        for e in expected:
+            (found if e in names_joined else missing).append(e)
 
         results[category] = {
             "expected": len(expected),
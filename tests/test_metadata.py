@@ -0,0 +1,91 @@
+"""Unit tests for the meta helpers in utils/metadata."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from srd_builder.utils import metadata
+from srd_builder.utils.metadata import read_schema_version
+
+
+def test_read_schema_version_is_cached_per_name(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    schema = tmp_path / "widget.schema.json"
+    schema.write_text(json.dumps({"version": "1.0.0"}), encoding="utf-8")
+    monkeypatch.setattr(metadata, "SCHEMA_DIR", tmp_path)
+    read_schema_version.cache_clear()
+
+    try:
+        assert read_schema_version("widget") == "1.0.0"
+
+        schema.write_text(json.dumps({"version": "2.0.0"}), encoding="utf-8")
+        assert read_schema_version("widget") == "1.0.0"
+
+        read_schema_version.cache_clear()
+        assert read_schema_version("widget") == "2.0.0"
+
+        with pytest.raises(FileNotFoundError):
+            read_schema_version("missing")
+    finally:
+        read_schema_version.cache_clear()
+
+
+def test_extraction_status_from_files_in_dist_dir(tmp_path: Path) -> None:
+    (tmp_path / "monsters.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "spells.json").write_text("{}", encoding="utf-8")
+
+    status = metadata._compute_extraction_status(
+        dist_dir=tmp_path,
+        monsters_complete=False,
+        equipment_complete=False,
+        spells_complete=False,
+        classes_complete=False,
+    )
+
+    assert list(status) == list(metadata.ALL_DATASETS)
+    assert {k for k, v in status.items() if v == "complete"} == {"monsters", "spells"}
+
+    missing = metadata._compute_extraction_status(
+        dist_dir=tmp_path / "absent",
+        monsters_complete=True,
+        equipment_complete=True,
+        spells_complete=True,
+        classes_complete=True,
+    )
+    assert set(missing.values()) == {"in_progress"}
+
+
+def test_wrap_with_meta_puts_meta_first() -> None:
+    document = metadata.wrap_with_meta(
+        {"items": [1, 2], "index": {}}, ruleset="srd_5_1", schema_version="1.0.0"
+    )
+
+    assert list(document) == ["_meta", "items", "index"]
+    assert type(document) is dict
+    assert document["items"] == [1, 2]
+
+
+def test_build_page_index_returns_independent_copies() -> None:
+    first = metadata.build_page_index(
+        monsters_page_range=None,
+        equipment_page_range=None,
+        spells_page_range=None,
+        table_page_index={"reference_tables": [{"id": "table:x"}]},
+    )
+    name = next(iter(metadata.PAGE_INDEX))
+    first[name]["start"] = -1
+
+    second = metadata.build_page_index(
+        monsters_page_range=None,
+        equipment_page_range=None,
+        spells_page_range=None,
+        table_page_index=None,
+    )
+
+    assert second[name]["start"] == metadata.PAGE_INDEX[name]["pages"]["start"]
+    assert first["reference_tables"] == [{"id": "table:x"}]
+    assert "reference_tables" not in second
@@ -158,3 +158,118 @@ def test_poison_table_format(tables_raw):
 
     # Expect around 14 poisons (may have extra rows due to split-column extraction)
     assert len(table["rows"]) >= 14, f"Expected at least 14 poison rows, got {len(table['rows'])}"
+
+
+def test_check_expected_rows_warns_only_on_mismatch(caplog):
+    """Row-count expectations from extraction_metadata are checked in one place."""
+    from srd_builder.extract.engine import check_expected_rows
+    from srd_builder.extract.patterns import RawTable
+
+    table = RawTable("table:t", "t", 1, ["A"], [["x"], ["y"]], "text_region")
+
+    assert check_expected_rows(table, {"validation": {"expected_rows": 2}})
+    assert check_expected_rows(table, {})
+    assert not caplog.records
+
+    assert not check_expected_rows(table, {"validation": {"expected_rows": 3}})
+    assert "t: expected 3 rows, extracted 2" in caplog.text
+
+
+def test_extract_all_tables_only_runs_requested_targets(tmp_path, monkeypatch):
+    """A subset run extracts just the named tables from the shared document."""
+    import fitz
+
+    from srd_builder.extract import engine
+
+    pdf = tmp_path / "blank.pdf"
+    doc = fitz.open()
+    doc.new_page()
+    doc.save(str(pdf))
+    doc.close()
+
+    seen = []
+
+    def fake_extract(self, target):
+        seen.append(target["simple_name"])
+        return engine.RawTable(target["id"], target["simple_name"], 1, [], [], "stub")
+
+    monkeypatch.setattr(engine.TableExtractor, "_extract_single_table", fake_extract)
+
+    with engine.TableExtractor(pdf) as extractor:
+        tables = extractor.extract_all_tables(only=["armor", "weapons"])
+        with pytest.raises(ValueError, match="no_such_table"):
+            extractor.extract_all_tables(only=["no_such_table"])
+
+    assert seen == [
+        t["simple_name"] for t in TARGET_TABLES if t["simple_name"] in {"armor", "weapons"}
+    ]
+    assert [t.simple_name for t in tables] == seen
+
+
+def _blank_pdf(path):
+    import fitz
+
+    doc = fitz.open()
+    doc.new_page()
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def test_closing_one_extractor_leaves_the_shared_handle_open(tmp_path):
+    """Only the run owner closes the shared document, never an extractor."""
+    from srd_builder.extract import engine
+    from srd_builder.utils.pdf_probe import close_shared_pdfs
+
+    pdf = _blank_pdf(tmp_path / "blank.pdf")
+    try:
+        first = engine.TableExtractor(pdf)
+        second = engine.TableExtractor(pdf)
+        doc = second.doc
+
+        first.close()
+
+        assert not doc.is_closed
+        assert second.doc is doc
+        assert len(second.doc) == 1
+    finally:
+        close_shared_pdfs()
+
+    assert doc.is_closed
+    # A later lookup reopens rather than handing back the closed handle
+    assert not second.doc.is_closed
+    close_shared_pdfs()
+
+
+def test_extract_tables_to_json_releases_shared_handle(tmp_path, monkeypatch):
+    """The one-shot helper owns its run and closes the shared document."""
+    from srd_builder.extract import engine
+    from srd_builder.utils import pdf_probe
+
+    pdf = _blank_pdf(tmp_path / "blank.pdf")
+    monkeypatch.setattr(engine.TableExtractor, "extract_all_tables", lambda self, **_: [])
+
+    engine.extract_tables_to_json(pdf, tmp_path / "tables_raw.json")
+
+    assert pdf_probe._shared_docs == {}
+    assert json.loads((tmp_path / "tables_raw.json").read_text()) == {"tables": []}
+
+
+def test_closing_an_extractor_keeps_the_page_word_cache(tmp_path, monkeypatch):
+    """The word cache is run-wide; only the run owner clears it."""
+    from srd_builder.extract import engine
+    from srd_builder.extract.text_parser_utils import _page_words, page_words
+    from srd_builder.utils.pdf_probe import close_shared_pdfs
+
+    pdf = _blank_pdf(tmp_path / "blank.pdf")
+    try:
+        with engine.TableExtractor(pdf):
+            page_words(pdf, 1)
+        assert _page_words.cache_info().currsize >= 1
+    finally:
+        close_shared_pdfs()
+
+    monkeypatch.setattr(engine.TableExtractor, "extract_all_tables", lambda self, **_: [])
+    engine.extract_tables_to_json(pdf, tmp_path / "tables_raw.json")
+
+    assert _page_words.cache_info().currsize == 0
@@ -0,0 +1,192 @@
+"""Tests for utils/table_indexer discovery and reporting.
+
+Discovery runs against small synthetic PDFs with ruled grids built in
+``tmp_path``, so it does not depend on the (gitignored) SRD source PDF.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import fitz
+import pytest
+
+from srd_builder.utils import table_indexer
+from srd_builder.utils.table_indexer import TableIndexer
+
+
+def _draw_grid(page: fitz.Page, x0: float, y0: float, rows: list[list[str]]) -> None:
+    col_width, row_height = 120, 20
+    for r, row in enumerate(rows):
+        for c, text in enumerate(row):
+            rect = fitz.Rect(
+                x0 + c * col_width,
+                y0 + r * row_height,
+                x0 + (c + 1) * col_width,
+                y0 + (r + 1) * row_height,
+            )
+            page.draw_rect(rect, color=(0, 0, 0), width=0.5)
+            page.insert_text((rect.x0 + 3, rect.y1 - 6), text, fontsize=9)
+
+
+def _write_table_pdf(path: Path, page_count: int) -> Path:
+    doc = fitz.open()
+    for i in range(page_count):
+        page = doc.new_page(width=612, height=792)
+        page.insert_text((72, 60), f"Section {i + 1}", fontsize=20)
+        _draw_grid(page, 72, 100, [["Level", "Proficiency Bonus"], ["1st", "+2"], ["2nd", "+2"]])
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def test_discover_all_tables_reads_headers_and_section(tmp_path: Path) -> None:
+    pdf = _write_table_pdf(tmp_path / "tables.pdf", 2)
+
+    tables = TableIndexer(pdf).discover_all_tables(workers=1)
+
+    assert [(t.page, t.table_index) for t in tables] == [(1, 0), (2, 0)]
+    assert tables[0].headers == ["Level", "Proficiency Bonus"]
+    assert tables[0].row_count == 2
+    assert tables[0].section_context == "Section 1"
+    assert tables[0].estimated_id == "proficiency_bonus"
+
+
+def test_parallel_discovery_matches_serial_page_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pdf = _write_table_pdf(tmp_path / "tables.pdf", 5)
+    monkeypatch.setattr(table_indexer, "MIN_PAGES_FOR_WORKERS", 1)
+
+    indexer = TableIndexer(pdf)
+    serial = indexer.discover_all_tables(workers=1)
+    parallel = indexer.discover_all_tables(workers=2)
+
+    assert parallel == serial
+    assert [t.page for t in parallel] == [1, 2, 3, 4, 5]
+
+
+def test_indexer_keeps_document_open_until_closed(tmp_path: Path) -> None:
+    pdf = _write_table_pdf(tmp_path / "tables.pdf", 2)
+
+    with TableIndexer(pdf) as indexer:
+        indexer.discover_all_tables(workers=1)
+        doc = indexer.doc
+        assert indexer._section_context == {0: "Section 1", 1: "Section 2"}
+
+        indexer.discover_all_tables(start_page=2, workers=1)
+        assert indexer.doc is doc
+
+    assert doc.is_closed
+    assert indexer._section_context == {}
+
+
+def test_section_context_only_read_for_pages_with_tables(tmp_path: Path) -> None:
+    pdf = _write_table_pdf(tmp_path / "tables.pdf", 1)
+    with fitz.open(str(pdf)) as doc:
+        page = doc.new_page(width=612, height=792)
+        page.insert_text((72, 60), "No Tables Here", fontsize=20)
+        doc.saveIncr()
+
+    with TableIndexer(pdf) as indexer:
+        tables = indexer.discover_all_tables(workers=1)
+
+        assert len(indexer.doc) == 2
+        assert [t.section_context for t in tables] == ["Section 1"]
+        assert indexer._section_context == {0: "Section 1"}
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        (["Challenge Rating", "XP"], "experience_by_cr"),
+        (["Level", "Proficiency Bonus"], "proficiency_bonus"),
+        (["Level", "1st", "2nd", "3rd"], "spell_slots"),
+        (["Size", "Space"], "creature_size"),
+        (["Armor", "Cost"], "armor"),
+        (["Name", "Weight"], None),
+        ([], None),
+    ],
+)
+def test_estimate_table_id_first_pattern_with_two_keyword_hits(
+    tmp_path: Path, headers: list[str], expected: str | None
+) -> None:
+    indexer = TableIndexer(_write_table_pdf(tmp_path / "tables.pdf", 1))
+
+    assert indexer._estimate_table_id(headers, None) == expected
+
+
+def test_skipped_pages_are_never_scanned(tmp_path: Path) -> None:
+    pdf = _write_table_pdf(tmp_path / "tables.pdf", 3)
+
+    with TableIndexer(pdf) as indexer:
+        tables = indexer._discover_pages(range(3), skip_pages=frozenset({2}))
+
+        assert [t.page for t in tables] == [1, 3]
+        assert 1 not in indexer._section_context  # page 2, 0-indexed
+
+
+def test_generate_report_counts_pages_and_ids(tmp_path: Path) -> None:
+    pdf = _write_table_pdf(tmp_path / "tables.pdf", 3)
+
+    with TableIndexer(pdf) as indexer:
+        indexer.discover_all_tables(start_page=2, workers=1)
+        report = indexer.generate_report()
+
+    assert report["total_tables"] == 2
+    assert report["pages_with_tables"] == 2
+    assert report["page_range"] == (2, 3)
+    assert report["tables_by_page"] == {2: 1, 3: 1}
+    assert report["tables_by_id"] == {"proficiency_bonus": 2}
+    assert [t["page"] for t in report["tables"]] == [2, 3]
+
+
+def test_check_target_coverage_splits_found_and_missing(tmp_path: Path) -> None:
+    pdf = _write_table_pdf(tmp_path / "tables.pdf", 2)
+
+    with TableIndexer(pdf) as indexer:
+        indexer.discover_all_tables(workers=1)
+        coverage = indexer.check_target_coverage([5, 2, 1, 9])
+
+    assert coverage == {"found": [1, 2], "missing": [5, 9], "coverage_percent": 50.0}
+
+
+def test_page_index_reference_tables_follow_extracted_ids(tmp_path: Path) -> None:
+    from srd_builder.extract.table_targets import TARGET_TABLES
+
+    indexer = TableIndexer(_write_table_pdf(tmp_path / "tables.pdf", 1))
+    multi_page = next(t for t in TARGET_TABLES if isinstance(t["page"], list))
+    wanted = [TARGET_TABLES[0]["id"], multi_page["id"]]
+
+    refs = indexer.generate_page_index_for_meta(wanted)["reference_tables"]
+    assert [r["id"] for r in refs] == [t["id"] for t in TARGET_TABLES if t["id"] in wanted]
+    page = multi_page["page"]
+    assert isinstance(page, list)
+    assert refs[-1]["page"] == f"{page[0]}-{page[-1]}"
+
+    everything = indexer.generate_page_index_for_meta()["reference_tables"]
+    assert len(everything) == len(TARGET_TABLES)
+    assert "reference_tables" not in indexer.generate_page_index_for_meta([])
+
+
+@pytest.mark.parametrize(
+    ("start_page", "end_page"),
+    [(5, 2), (8, None), (3, 2)],
+)
+def test_discover_all_tables_empty_or_inverted_range_finds_nothing(
+    tmp_path: Path, start_page: int, end_page: int | None
+) -> None:
+    pdf = _write_table_pdf(tmp_path / "tables.pdf", 6)
+
+    with TableIndexer(pdf) as indexer:
+        assert indexer.discover_all_tables(start_page, end_page, workers=1) == []
+
+
+def test_discover_pages_empty_or_inverted_range_finds_nothing(tmp_path: Path) -> None:
+    pdf = _write_table_pdf(tmp_path / "tables.pdf", 6)
+
+    with TableIndexer(pdf) as indexer:
+        assert indexer._discover_pages(range(4, 1)) == []
+        assert indexer._discover_pages(range(3, 3)) == []
+        assert indexer._discover_pages(range(9, 12)) == []
+        assert indexer._section_context == {}
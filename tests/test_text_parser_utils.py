@@ -0,0 +1,151 @@
+"""Unit tests for the coordinate-based word helpers in extract/text_parser_utils.
+
+These run against tiny synthetic PDFs built in ``tmp_path`` so they do not
+depend on the (gitignored) SRD source PDF.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import fitz
+import pytest
+
+from srd_builder.extract.text_parser_utils import (
+    clear_page_words,
+    column_edges,
+    find_currency_index,
+    group_words_by_y,
+    is_header_row,
+    merge_continuation_rows,
+    page_words,
+    sorted_word_rows,
+    split_at_currency,
+    split_row_columns,
+)
+from srd_builder.utils.pdf_probe import close_shared_pdfs, shared_pdf
+
+
+def _write_pdf(path: Path, lines: list[tuple[float, float, str]]) -> Path:
+    doc = fitz.open()
+    page = doc.new_page(width=612, height=792)
+    for x, y, text in lines:
+        page.insert_text((x, y), text, fontsize=9)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def test_page_words_returns_cached_word_tuples(tmp_path: Path) -> None:
+    pdf = _write_pdf(tmp_path / "words.pdf", [(72, 100, "Padded armor 5 gp")])
+
+    first = page_words(pdf, 1)
+    second = page_words(str(pdf), 1)
+
+    assert [w[4] for w in first] == ["Padded", "armor", "5", "gp"]
+    assert second is first
+
+    clear_page_words()
+    assert page_words(pdf, 1) is not first
+
+
+def test_page_words_rereads_when_file_changes(tmp_path: Path) -> None:
+    pdf = _write_pdf(tmp_path / "words.pdf", [(72, 100, "Chain mail")])
+    assert [w[4] for w in page_words(pdf, 1)] == ["Chain", "mail"]
+
+    _write_pdf(pdf, [(72, 100, "Plate")])
+    stat = pdf.stat()
+    os.utime(pdf, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert [w[4] for w in page_words(pdf, 1)] == ["Plate"]
+
+
+def test_shared_pdf_reuses_one_handle_until_closed(tmp_path: Path) -> None:
+    pdf = _write_pdf(tmp_path / "shared.pdf", [(72, 100, "Shield")])
+
+    doc = shared_pdf(pdf)
+    assert shared_pdf(str(pdf)) is doc
+
+    close_shared_pdfs()
+    assert doc.is_closed
+    assert shared_pdf(pdf) is not doc
+    close_shared_pdfs()
+
+
+def test_sorted_word_rows_matches_grouped_then_sorted() -> None:
+    words = [
+        (300.0, 100.4, 0, 0, "5", 0, 0, 0),
+        (72.0, 99.6, 0, 0, "Padded", 0, 0, 0),
+        (120.0, 100.0, 0, 0, "armor", 0, 0, 0),
+        (72.0, 112.0, 0, 0, "Leather", 0, 0, 0),
+        (120.0, 112.0, 0, 0, "a", 0, 0, 0),
+        (120.0, 112.0, 0, 0, "b", 0, 0, 0),
+        (500.0, 100.0, 0, 0, "outside", 0, 0, 0),
+    ]
+
+    expected = [
+        (y, sorted(row, key=lambda w: w[0]))
+        for y, row in sorted(group_words_by_y(words, x_max=400).items())
+    ]
+
+    assert list(sorted_word_rows(words, x_max=400)) == expected
+    assert [[t for _, t in row] for _, row in expected] == [
+        ["Padded", "armor", "5"],
+        ["Leather", "a", "b"],
+    ]
+
+
+def test_split_row_columns_matches_per_column_scan() -> None:
+    row = [
+        (10.0, "Chain"),
+        (30.0, "mail"),
+        (100.0, "75"),
+        (104.0, "gp"),
+        (150.0, "16"),
+        (260.0, "x"),
+    ]
+    edges = column_edges([90, 140], 3, x_min=0, x_max=250)
+
+    expected = [
+        " ".join(t for x, t in row if lo <= x < hi)
+        for lo, hi in zip(edges, edges[1:], strict=False)
+    ]
+
+    assert edges == [0, 90, 140, 250]
+    assert split_row_columns(row, edges) == expected == ["Chain mail", "75 gp", "16"]
+
+
+def test_column_edges_applies_region_offset() -> None:
+    assert column_edges([40], 2, x_min=300, x_max=500, offset=300) == [300, 340, 500]
+
+
+def test_is_header_row_needs_majority_of_exact_matches() -> None:
+    names = {"level", "1st", "2nd"}
+
+    assert is_header_row(["Level", "1st", "2nd"], names)
+    assert not is_header_row(["1st", "3", "2"], names)
+    assert not is_header_row(["", ""], names)
+
+
+def test_merge_continuation_rows_folds_empty_first_cell() -> None:
+    rows = [["Waterskin", "2 sp", "5 lb."], ["", "", "(full)"], ["Whetstone", "1 cp", "1 lb."]]
+
+    assert merge_continuation_rows(rows) == [
+        ["Waterskin", "2 sp", "5 lb. (full)"],
+        ["Whetstone", "1 cp", "1 lb."],
+    ]
+
+
+def test_split_at_currency_rejects_leading_currency_word() -> None:
+    words = ["Crowbar", "2", "gp", "5", "lb."]
+    assert find_currency_index(words) == 2
+    assert split_at_currency(words, 2) == (
+        ["Crowbar"],
+        "2 gp",
+        ["5", "lb."],
+    )
+
+    assert find_currency_index(["gp", "5"]) == 0
+    with pytest.raises(ValueError, match="no amount"):
+        split_at_currency(["gp", "5"], 0)
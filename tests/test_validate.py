@@ -0,0 +1,173 @@
+"""Tests for the schema validation helpers in utils/validate."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pytest
+from jsonschema.exceptions import SchemaError
+
+from srd_builder.utils import validate
+from srd_builder.utils.validate import compiled_validator, validate_one_dataset
+
+
+def _write_json(path: Path, payload: object) -> Path:
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    return path
+
+
+def _schema(required: list[str]) -> dict[str, object]:
+    return {
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "type": "object",
+        "required": required,
+    }
+
+
+def test_compiled_validator_is_reused_until_schema_changes(tmp_path: Path) -> None:
+    schema = _write_json(tmp_path / "item.schema.json", _schema(["id"]))
+
+    first = compiled_validator(schema)
+    assert compiled_validator(schema) is first
+
+    _write_json(schema, _schema(["id", "name"]))
+    stat = schema.stat()
+    os.utime(schema, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = compiled_validator(schema)
+    assert second is not first
+    assert not second.is_valid({"id": "item:a"})
+
+
+def test_compiled_validator_rejects_malformed_schema(tmp_path: Path) -> None:
+    schema = _write_json(tmp_path / "bad.schema.json", {"type": 12})
+
+    with pytest.raises(SchemaError):
+        compiled_validator(schema)
+
+
+def test_validate_one_dataset_reports_every_error(tmp_path: Path) -> None:
+    schema = _write_json(tmp_path / "item.schema.json", _schema(["id", "name"]))
+    data = _write_json(
+        tmp_path / "items.json",
+        {"items": [{"id": "item:a", "name": "A"}, {"id": "item:b"}, {}]},
+    )
+
+    report = validate_one_dataset(data_path=data, schema_path=schema)
+
+    assert report["status"] == "FAIL"
+    assert (report["total"], report["failed"]) == (3, 2)
+    assert report["categories"] == {"required@<root>": 3}
+    assert [e["id"] for e in report["errors"]] == ["item:b", "<no-id>", "<no-id>"]
+
+
+def _raw_dir_with_pdf(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, blob: bytes) -> Path:
+    raw_dir = tmp_path / "demo" / "raw"
+    raw_dir.mkdir(parents=True)
+    (raw_dir / "source.pdf").write_bytes(blob)
+    monkeypatch.setattr(validate, "RULESETS_DIR", tmp_path)
+    return raw_dir
+
+
+def _count_hashes(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    calls: list[Path] = []
+
+    def counting_sha256(path: Path) -> str:
+        calls.append(path)
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+
+    monkeypatch.setattr(validate, "pdf_sha256", counting_sha256)
+    return calls
+
+
+def test_check_pdf_hash_accepts_matching_digest(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    blob = b"%PDF-1.7 fake" * 50_000
+    raw_dir = _raw_dir_with_pdf(tmp_path, monkeypatch, blob)
+    _write_json(raw_dir / "pdf_meta.json", {"pdf_sha256": hashlib.sha256(blob).hexdigest()})
+
+    validate._check_pdf_hash("demo")
+
+    assert "PDF hash matches" in capsys.readouterr().out
+
+
+def test_check_pdf_hash_rejects_changed_pdf(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    raw_dir = _raw_dir_with_pdf(tmp_path, monkeypatch, b"%PDF-1.7 edited")
+    _write_json(raw_dir / "pdf_meta.json", {"pdf_sha256": hashlib.sha256(b"orig").hexdigest()})
+
+    with pytest.raises(ValueError, match="PDF hash mismatch"):
+        validate._check_pdf_hash("demo")
+
+
+def test_pdf_hash_sidecar_skips_rehash_until_pdf_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    raw_dir = _raw_dir_with_pdf(tmp_path, monkeypatch, b"%PDF-1.7 one")
+    pdf = raw_dir / "source.pdf"
+    calls = _count_hashes(monkeypatch)
+
+    first = validate._cached_pdf_sha256(pdf)
+    assert validate._cached_pdf_sha256(pdf) == first
+    assert len(calls) == 1
+    assert json.loads((raw_dir / validate.PDF_HASH_CACHE_NAME).read_text())["pdf_sha256"] == first
+
+    pdf.write_bytes(b"%PDF-1.7 two, longer")
+    assert validate._cached_pdf_sha256(pdf) == hashlib.sha256(pdf.read_bytes()).hexdigest()
+    assert len(calls) == 2
+
+
+def test_check_pdf_hash_always_rehashes_without_opt_in(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    blob = b"%PDF-1.7 fake"
+    raw_dir = _raw_dir_with_pdf(tmp_path, monkeypatch, blob)
+    _write_json(raw_dir / "pdf_meta.json", {"pdf_sha256": hashlib.sha256(blob).hexdigest()})
+    calls = _count_hashes(monkeypatch)
+
+    validate._check_pdf_hash("demo")
+    validate._check_pdf_hash("demo")
+
+    assert len(calls) == 2
+    assert sorted(p.name for p in raw_dir.iterdir()) == ["pdf_meta.json", "source.pdf"]
+
+
+def test_check_pdf_hash_opt_in_reuses_sidecar(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    blob = b"%PDF-1.7 fake"
+    raw_dir = _raw_dir_with_pdf(tmp_path, monkeypatch, blob)
+    _write_json(raw_dir / "pdf_meta.json", {"pdf_sha256": hashlib.sha256(blob).hexdigest()})
+    calls = _count_hashes(monkeypatch)
+
+    validate._check_pdf_hash("demo", reuse_hash_cache=True)
+    validate._check_pdf_hash("demo", reuse_hash_cache=True)
+
+    assert len(calls) == 1
+    assert (raw_dir / validate.PDF_HASH_CACHE_NAME).exists()
+
+
+def test_pdf_hash_sidecar_write_failure_leaves_no_tmp_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    raw_dir = _raw_dir_with_pdf(tmp_path, monkeypatch, b"%PDF-1.7 one")
+
+    def failing_replace(src: Path, dst: Path) -> None:
+        raise PermissionError("read-only")
+
+    monkeypatch.setattr(validate.os, "replace", failing_replace)
+
+    digest = validate._cached_pdf_sha256(raw_dir / "source.pdf")
+
+    assert digest == hashlib.sha256(b"%PDF-1.7 one").hexdigest()
+    assert sorted(p.name for p in raw_dir.iterdir()) == ["source.pdf"]
+
+
+def test_reuse_pdf_hash_is_opt_in_on_the_cli() -> None:
+    assert validate.parse_args(["--ruleset", "demo"]).reuse_pdf_hash is False
+    assert validate.parse_args(["--ruleset", "demo", "--reuse-pdf-hash"]).reuse_pdf_hash is True